@@ -1,118 +1,346 @@
+import atexit
+import functools
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+    from numba import njit, types
+    from numba.typed import Dict
+except ImportError:
+    # Numba est optionnel : sans lui, les fonctions restent du Python pur
+    np = None
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fonction: fonction
+
+try:
+    from numba import cuda
+    # Sans carte graphique (ou sans pilote CUDA), tout reste sur le processeur
+    CUDA = cuda.is_available()
+except ImportError:
+    CUDA = False
+
+try:
+    # Noyau compilé optionnel (cythonize -i othello_core.pyx) : s'il est
+    # présent, la recherche de l'IA passe par lui
+    import othello_core
+except ImportError:
+    othello_core = None
+
+# Sous Numba, les bitboards doivent rester en uint64 : un littéral entier serait
+# typé int64 et le mélange des deux donne des flottants.
+_u64 = np.uint64 if np is not None else int
+_i64 = np.int64 if np is not None else int
+
 # Définition de la taille du plateau (8x8 pour Othello)
 TAILLE = 8
 
+# Le plateau est représenté par deux entiers de 64 bits (bitboards) : la case
+# (x, y) correspond au bit numéro 8*x + y. Un état de jeu est un couple
+# (mien, adverse) vu du joueur qui a le trait. Un coup est le bitboard de
+# la seule case jouée, 0 signifiant « aucun coup ».
+PLEIN = _u64(0xFFFFFFFFFFFFFFFF)
+ZERO, UN = _u64(0), _u64(1)
+
+# Bornes des scores de recherche : l'évaluation reste dans [-SCORE_MAX, SCORE_MAX]
+# (voir evaluer), INFINI tient donc dans un entier 16 bits avec de la marge
+INFINI = 32000
+
+# Nature du score stocké dans la table de transposition
+EXACT, BORNE_INF, BORNE_SUP = 0, 1, 2
+
+# Au-delà de ce nombre d'entrées, la table de transposition est vidée
+TAILLE_MAX_TABLE = 1_000_000
+
+# Approfondissement itératif de l'IA : profondeur maximale et budget de temps
+# (en secondes) au-delà duquel on ne lance plus d'itération plus profonde
+PROFONDEUR_MAX = 6
+DUREE_MAX = 1.0
+
+# Les coups de la racine peuvent être répartis entre plusieurs processus à
+# partir de cette profondeur (voir PARALLELE)
+PROFONDEUR_PARALLELE = 5
+
+# Codes numériques des joueurs : l'adversaire de `joueur` est simplement `-joueur`
+VIDE, X, O = 0, 1, -1
+SYMBOLES = {VIDE: ' ', X: 'X', O: 'O'}
+
 # Les 8 directions possibles autour d'une case (horizontal, vertical, diagonales)
-# Ces directions sont utilisées pour vérifier les captures de pions dans toutes les directions
-DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1),
-              (0, -1), (0, 1),
-              (1, -1), (1, 0), (1, 1)]
+# Chaque direction est un couple (décalage, masque) : le décalage vaut 8*dx + dy
+# et le masque retire, après le décalage, les cases arrivées sur la mauvaise
+# ligne (un pion de la colonne 7 décalé vers l'est arriverait en colonne 0).
+_SANS_COLONNE_0 = 0xFEFEFEFEFEFEFEFE
+_SANS_COLONNE_7 = 0x7F7F7F7F7F7F7F7F
+DIRECTIONS = ((-9, _SANS_COLONNE_7), (-8, None), (-7, _SANS_COLONNE_0),
+              (-1, _SANS_COLONNE_7), (1, _SANS_COLONNE_0),
+              (7, _SANS_COLONNE_7), (8, None), (9, _SANS_COLONNE_0))
 
+# Table classique des poids positionnels d'Othello : les coins valent le plus,
+# les cases voisines des coins (cases X et C) sont dangereuses
+POIDS = [[100, -20, 10, 5, 5, 10, -20, 100],
+         [-20, -50, -2, -2, -2, -2, -50, -20],
+         [10, -2, -1, -1, -1, -1, -2, 10],
+         [5, -2, -1, -1, -1, -1, -2, 5],
+         [5, -2, -1, -1, -1, -1, -2, 5],
+         [10, -2, -1, -1, -1, -1, -2, 10],
+         [-20, -50, -2, -2, -2, -2, -50, -20],
+         [100, -20, 10, 5, 5, 10, -20, 100]]
 
-# Fonction pour créer et initialiser le plateau de jeu
-def initialiser_plateau():
-   
-    plateau = [[' ' for _ in range(TAILLE)] for _ in range(TAILLE)]
-    plateau[3][3], plateau[4][4] = 'O', 'O'
-    plateau[3][4], plateau[4][3] = 'X', 'X'
-    return plateau
-
-
-# Retourne la liste des coups valides pour un joueur donné
-def coups_valides(plateau, joueur):
-  
-    adversaire = 'O' if joueur == 'X' else 'X'
-    valides = []
+
+# Regroupe les cases de même poids en un bitboard, de la meilleure classe à la pire
+def _classes_poids():
+    classes = {}
     for x in range(TAILLE):
         for y in range(TAILLE):
-            # On ne peut jouer que sur une case vide
-            if plateau[x][y] != ' ':
+            classes[POIDS[x][y]] = classes.get(POIDS[x][y], 0) | 1 << (TAILLE * x + y)
+    return tuple((poids, _u64(masque)) for poids, masque in sorted(classes.items(), reverse=True))
+
+
+CLASSES_POIDS = _classes_poids()
+
+# Masques de l'évaluation : les coins, et les cases X (en diagonale des coins)
+# qui offrent souvent un coin à l'adversaire
+COINS = _u64(0x8100000000000081)
+CASES_X = _u64(0x0042000000004200)
+BONUS_COIN = 10
+MALUS_CASE_X = 5
+SCORE_MAX = 64 + 4 * BONUS_COIN + 4 * MALUS_CASE_X
+
+
+# Fonction pour créer et initialiser le plateau de jeu
+def initialiser_plateau():
+    """
+    Retourne la position de départ sous la forme (pions X, pions O).
+    X commence la partie, ce couple est donc aussi (mien, adverse) pour le premier joueur.
+    """
+    return 0x0000000810000000, 0x0000001008000000
+
+
+# Les deux fonctions les plus appelées, coups_valides et retournements, sont
+# générées à l'import : chaque direction y est déroulée avec son décalage et son
+# masque écrits en dur, sans boucle ni accès à DIRECTIONS.
+def _litteral(valeur):
+    # Sous Numba, les masques doivent être des uint64 (voir _u64)
+    return hex(valeur) if np is None else f"_u64({hex(valeur)})"
+
+
+def _decaler_texte(variable, decalage):
+    if decalage > 0:
+        return f"({variable} << {decalage})"
+    return f"({variable} >> {-decalage})"
+
+
+def _executer(source, nom):
+    espace = {}
+    exec(compile(source, f"<{nom}>", "exec"), globals(), espace)
+    return espace[nom]
+
+
+def _compiler(source, nom, signature):
+    # Pas de cache Numba possible pour une fonction sans fichier source
+    return njit(signature)(_executer(source, nom))
+
+
+# Retourne le masque des coups valides pour le joueur qui a le trait : depuis
+# nos pions, on propage à travers une suite de pions adverses (6 au plus) et
+# la case qui suit doit être vide
+def _source_coups_valides():
+    lignes = ["def coups_valides(mien, adverse):",
+              "    vides = ~(mien | adverse) & PLEIN",
+              "    valides = ZERO"]
+    for decalage, masque in DIRECTIONS:
+        suite = "adverse" if masque is None else f"adverse & {_litteral(masque)}"
+        lignes.append(f"    a = {suite}")
+        lignes.append(f"    t = {_decaler_texte('mien', decalage)} & a")
+        lignes += [f"    t |= {_decaler_texte('t', decalage)} & a"] * 5
+        arrivee = "vides" if masque is None else f"vides & {_litteral(masque)}"
+        lignes.append(f"    valides |= {_decaler_texte('t', decalage)} & {arrivee}")
+    lignes.append("    return valides")
+    return "\n".join(lignes) + "\n"
+
+
+coups_valides = _compiler(_source_coups_valides(), "coups_valides", 'uint64(uint64, uint64)')
+
+
+# Retourne le bitboard des pions adverses encadrés par un coup : depuis le pion
+# joué, on collecte la suite de pions adverses consécutifs de chaque direction,
+# retournée seulement si elle se termine sur un pion du joueur. La suite est
+# étendue par doublement : 1, 2, puis 4 et 6 cases grâce aux paires de pions
+# adverses voisins. Le code est sans branchement (l'issue de chaque test est
+# imprévisible pour le processeur) : la suite est gardée par un masque plein ou vide.
+def _source_retournements():
+    lignes = ["def retournements(mien, adverse, pion):",
+              "    retournes = ZERO"]
+    for decalage, masque in DIRECTIONS:
+        suite = "adverse" if masque is None else f"adverse & {_litteral(masque)}"
+        fin = "mien" if masque is None else f"mien & {_litteral(masque)}"
+        lignes.append(f"    a = {suite}")
+        lignes.append(f"    paires = a & {_decaler_texte('a', decalage)}")
+        lignes.append(f"    t = {_decaler_texte('pion', decalage)} & a")
+        lignes.append(f"    t |= {_decaler_texte('t', decalage)} & a")
+        lignes += [f"    t |= {_decaler_texte('t', 2 * decalage)} & paires"] * 2
+        encadree = f"{_decaler_texte('t', decalage)} & {fin}"
+        lignes.append(f"    retournes |= t & (ZERO - _u64({encadree} != ZERO))")
+    lignes.append("    return retournes")
+    return "\n".join(lignes) + "\n"
+
+
+# En Python pur, chaque opération coûte, alors qu'un test bien placé en évite
+# beaucoup : on génère plutôt une fonction par case jouée, où chaque direction
+# est une suite de tests de cases écrites en dur. Seules les directions qui
+# restent sur le plateau sont écrites, avec leur longueur exacte, et la plupart
+# s'arrêtent dès le premier test (pas de pion adverse voisin).
+def _source_retournements_case(case):
+    x, y = divmod(case, TAILLE)
+    lignes = ["def retournements_case(mien, adverse):",
+              "    retournes = 0"]
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            rayon = []
+            i, j = x + dx, y + dy
+            while (dx or dy) and 0 <= i < TAILLE and 0 <= j < TAILLE:
+                rayon.append(1 << (TAILLE * i + j))
+                i, j = i + dx, j + dy
+            if len(rayon) < 2:
                 continue
-            # Vérifier dans chaque direction si on peut capturer des pions
-            for dx, dy in DIRECTIONS:
-                i, j = x + dx, y + dy
-                trouvé = False
-                # Tant qu'on trouve des pions adverses dans cette direction
-                while 0 <= i < TAILLE and 0 <= j < TAILLE and plateau[i][j] == adversaire:
-                    i += dx
-                    j += dy
-                    trouvé = True
-                # Si on a trouvé des pions adverses et qu'ils sont suivis par un pion du joueur
-                if trouvé and 0 <= i < TAILLE and 0 <= j < TAILLE and plateau[i][j] == joueur:
-                    valides.append((x, y))
-                    break
-    return valides
+            # Après le test de adverse & rayon[k], les cases rayon[:k+1] sont adverses
+            lignes.append(f"    if adverse & {hex(rayon[0])}:")
+            for k in range(1, len(rayon)):
+                retrait = "    " * (k + 1)
+                lignes.append(f"{retrait}if mien & {hex(rayon[k])}:")
+                lignes.append(f"{retrait}    retournes |= {hex(sum(rayon[:k]))}")
+                if k + 1 < len(rayon):
+                    lignes.append(f"{retrait}elif adverse & {hex(rayon[k])}:")
+    lignes.append("    return retournes")
+    return "\n".join(lignes) + "\n"
+
+
+if np is None:
+    _RETOURNEMENTS_PAR_PION = {1 << case: _executer(_source_retournements_case(case), "retournements_case")
+                               for case in range(TAILLE * TAILLE)}
+
+    def retournements(mien, adverse, pion):
+        return _RETOURNEMENTS_PAR_PION[pion](mien, adverse)
+else:
+    retournements = _compiler(_source_retournements(), "retournements", 'uint64(uint64, uint64, uint64)')
 
 
 # Applique un coup en retournant les pions nécessaires
-def appliquer_coup(plateau, x, y, joueur):
+@njit('UniTuple(uint64, 2)(uint64, uint64, uint64)', cache=True)
+def appliquer_coup(mien, adverse, pion):
     """
-    Place un pion du joueur à la position (x,y) et retourne tous les pions
+    Place un pion du joueur sur la case donnée et retourne tous les pions
     adverses qui sont encadrés par ce coup selon les règles d'Othello.
 
     Args:
-        plateau: État actuel du plateau de jeu
-        x, y: Coordonnées où placer le pion
-        joueur: Symbole du joueur qui fait le coup ('X' ou 'O')
+        mien: Bitboard des pions du joueur qui fait le coup
+        adverse: Bitboard des pions de l'adversaire
+        pion: Bitboard de la seule case où placer le pion
 
-    Modifie directement le plateau de jeu sans retourner de valeur.
-    """
-    adversaire = 'O' if joueur == 'X' else 'X'
-    plateau[x][y] = joueur
-    # Vérifier chaque direction pour les retournements
-    for dx, dy in DIRECTIONS:
-        i, j = x + dx, y + dy
-        pions_à_retourner = []
-        # Collecter tous les pions adverses consécutifs dans cette direction
-        while 0 <= i < TAILLE and 0 <= j < TAILLE and plateau[i][j] == adversaire:
-            pions_à_retourner.append((i, j))
-            i += dx
-            j += dy
-        # Si on termine sur un pion du joueur, on peut retourner les pions collectés
-        if 0 <= i < TAILLE and 0 <= j < TAILLE and plateau[i][j] == joueur:
-            for (ix, iy) in pions_à_retourner:
-                plateau[ix][iy] = joueur
-
-
-# Vérifie si la partie est terminée
-def est_fin_partie(plateau):
+    Retourne:
+        Le nouveau couple (mien, adverse) ; les entiers étant immuables,
+        aucune copie du plateau n'est nécessaire.
     """
-    Détermine si la partie est terminée.
-    La partie est terminée quand aucun des deux joueurs ne peut plus faire de coup valide.
+    retournes = retournements(mien, adverse, pion)
+    return mien ^ (pion | retournes), adverse ^ retournes
 
-    Args:
-        plateau: État actuel du plateau de jeu
 
-    Retourne:
-        True si la partie est terminée, False sinon
-    """
-    return not coups_valides(plateau, 'X') and not coups_valides(plateau, 'O')
+# Compte les pions d'un bitboard
+if np is None:
+    _compter_pions = int.bit_count
+else:
+    @njit('int64(uint64)', cache=True)
+    def _compter_pions(pions):
+        # Numba ne connaît pas int.bit_count : comptage SWAR par paquets de bits
+        pions -= (pions >> UN) & _u64(0x5555555555555555)
+        pions = (pions & _u64(0x3333333333333333)) + ((pions >> _u64(2)) & _u64(0x3333333333333333))
+        pions = (pions + (pions >> _u64(4))) & _u64(0x0F0F0F0F0F0F0F0F)
+        return _i64((pions * _u64(0x0101010101010101)) >> _u64(56))
 
 
 # Fonction d'évaluation
-def evaluer(plateau, joueur):
+@njit('int64(uint64, uint64)', cache=True)
+def evaluer(mien, adverse):
     """
-    Évalue la position du plateau du point de vue du joueur spécifié.
-    Cette fonction simple compte la différence entre le nombre de pions
-    du joueur et ceux de l'adversaire.
+    Évalue la position du plateau du point de vue du joueur dont les pions sont `mien`.
+    Cette fonction compte la différence entre le nombre de pions du joueur et
+    ceux de l'adversaire, puis ajoute un bonus pour chaque coin occupé et un
+    malus pour chaque case X, qui a une valeur stratégique particulière.
 
-    Cette heuristique favorise les positions où le joueur a plus de pions que l'adversaire.
-    Dans une version plus avancée, on pourrait ajouter d'autres facteurs comme
-    le contrôle des coins et des bords qui ont une valeur stratégique plus importante.
+    Chaque terme ne coûte qu'un comptage de bits (popcount) sur un masque.
+    Le score est borné par SCORE_MAX (64 pions, 4 coins, 4 cases X).
 
     Args:
-        plateau: État actuel du plateau de jeu
-        joueur: Symbole du joueur pour lequel on évalue ('X' ou 'O')
+        mien: Bitboard des pions du joueur pour lequel on évalue
+        adverse: Bitboard des pions de l'adversaire
 
     Retourne:
         Un score numérique où une valeur positive indique un avantage pour le joueur
     """
-    compteur = sum(row.count(joueur) for row in plateau)
-    adversaire = 'O' if joueur == 'X' else 'X'
-    return compteur - sum(row.count(adversaire) for row in plateau)
+    return (_compter_pions(mien) - _compter_pions(adverse)
+            + BONUS_COIN * (_compter_pions(mien & COINS) - _compter_pions(adverse & COINS))
+            - MALUS_CASE_X * (_compter_pions(mien & CASES_X) - _compter_pions(adverse & CASES_X)))
+
+
+# Score d'une partie terminée : la seule différence de pions, sans les termes
+# positionnels d'evaluer, qui ne servent qu'à estimer une partie en cours
+@njit('int64(uint64, uint64)', cache=True)
+def score_final(mien, adverse):
+    return _compter_pions(mien) - _compter_pions(adverse)
+
+
+# Ordonne les coups du plus prometteur au moins prometteur pour favoriser les
+# coupes Alpha-Beta : d'abord selon le poids de la case, puis, à partir de la
+# profondeur 3, selon l'évaluation de la position obtenue un coup plus loin.
+# Le coup `premier` (celui de la table de transposition) passe avant tous les autres.
+# Les coups sont rangés dans pions[debut:] (et leurs notes dans notes[debut:]),
+# des tampons préalloués ; retourne l'indice qui suit le dernier coup rangé.
+@njit(cache=True)
+def _ordonner_coups(mien, adverse, coups, profondeur, premier, pions, notes, debut):
+    fin = debut
+    if premier & coups:
+        pions[fin] = premier
+        notes[fin] = INFINI
+        fin += 1
+        coups ^= premier
+    for poids, classe in CLASSES_POIDS:
+        reste = coups & classe
+        while reste:
+            pion = reste & (~reste + UN)
+            reste ^= pion
+            note = poids
+            if profondeur >= 3:
+                retournes = retournements(mien, adverse, pion)
+                note += evaluer(mien ^ (pion | retournes), adverse ^ retournes)
+            # Insertion en gardant les notes décroissantes (tri stable)
+            i = fin
+            while i > debut and notes[i - 1] < note:
+                pions[i] = pions[i - 1]
+                notes[i] = notes[i - 1]
+                i -= 1
+            pions[i] = pion
+            notes[i] = note
+            fin += 1
+    return fin
+
+
+# Retourne la liste des numéros de cases présentes dans un masque
+def liste_cases(masque):
+    cases = []
+    while masque:
+        bit = masque & -masque
+        cases.append(bit.bit_length() - 1)
+        masque ^= bit
+    return cases
 
 
 # Algorithme Minimax pour choisir le meilleur coup
-def minmax(plateau, profondeur, joueur, max_):
+def minmax(mien, adverse, profondeur, max_, passe=False):
     """
     Implémentation de l'algorithme Minimax pour déterminer le meilleur coup.
     Minimax est un algorithme récursif qui simule tous les coups possibles jusqu'à
@@ -122,92 +350,660 @@ def minmax(plateau, profondeur, joueur, max_):
     En mode minimisant (max_=False), il cherche à minimiser le score.
 
     Args:
-        plateau: État actuel du plateau de jeu
+        mien: Bitboard des pions du joueur dont c'est le tour
+        adverse: Bitboard des pions de l'adversaire
         profondeur: Nombre de coups à anticiper (plus c'est élevé, plus l'IA est forte mais lente)
-        joueur: Symbole du joueur dont c'est le tour ('X' ou 'O')
         max_: Boolean indiquant si on cherche à maximiser (True) ou minimiser (False) le score
+        passe: True si l'adversaire vient de passer son tour
 
     Retourne:
-        Un tuple (score, coup) où score est la valeur de la position et coup est le meilleur mouvement
+        Un tuple (score, case) où score est la valeur de la position du point de vue
+        du joueur maximisant et case est le meilleur mouvement
     """
-    # Si on atteint la profondeur 0 ou que le jeu est fini, on évalue le plateau
-    if profondeur == 0 or est_fin_partie(plateau):
-        return evaluer(plateau, joueur), None
+    # Si on atteint la profondeur 0, on évalue le plateau
+    if profondeur == 0:
+        return (evaluer(mien, adverse) if max_ else evaluer(adverse, mien)), None
 
-    # Liste des coups possibles pour ce joueur
-    coups = coups_valides(plateau, joueur)
-    # Si aucun coup possible, passer au tour de l'adversaire
+    # Masque des coups possibles pour ce joueur
+    coups = coups_valides(mien, adverse)
     if not coups:
-        score, _ = minmax(plateau, profondeur-1, 'O' if joueur == 'X' else 'X', not max_)
+        # Si l'adversaire vient aussi de passer, le jeu est fini
+        if passe:
+            return (score_final(mien, adverse) if max_ else score_final(adverse, mien)), None
+        # Sinon passer au tour de l'adversaire
+        score, _ = minmax(adverse, mien, profondeur-1, not max_, True)
         return score, None
 
     # Initialisation du meilleur score
-    meilleur_score = float('-inf') if max_ else float('inf')
+    meilleur_score = -INFINI if max_ else INFINI
     meilleur_coup = None
 
-    # On teste tous les coups possibles
-    for coup in coups:
-        # Copier le plateau pour ne pas modifier l'original
-        copie = [ligne[:] for ligne in plateau]
-        # Appliquer le coup sur la copie
-        appliquer_coup(copie, coup[0], coup[1], joueur)
-        # Appel récursif sur le nouveau plateau avec changement de joueur et inversion du max_
-        score, _ = minmax(copie, profondeur-1, 'O' if joueur == 'X' else 'X', not max_)
+    # On teste tous les coups possibles, pris un à un dans le masque sans
+    # construire de liste
+    while coups:
+        pion = coups & -coups
+        coups ^= pion
+        case = pion.bit_length() - 1
+        # Appliquer le coup : on obtient un nouveau couple sans toucher à l'original
+        nouveau_mien, nouvel_adverse = appliquer_coup(mien, adverse, pion)
+        # Appel récursif avec changement de joueur et inversion du max_
+        score, _ = minmax(nouvel_adverse, nouveau_mien, profondeur-1, not max_)
 
         # Mise à jour du meilleur score et coup selon qu'on cherche à maximiser ou minimiser
         if (max_ and score > meilleur_score) or (not max_ and score < meilleur_score):
             meilleur_score = score
-            meilleur_coup = coup
+            meilleur_coup = case
 
     # Retourner le meilleur score et le meilleur coup trouvé
     return meilleur_score, meilleur_coup
 
 
-# Algorithme Alpha-Beta pour choisir le meilleur coup
-def alpha_beta(plateau, profondeur, joueur, alpha, beta, maximisant):
+# Le noyau compilé reçoit les réglages de ce fichier, puis il est comparé aux
+# fonctions Python sur une partie jouée d'avance et sur une position avec coins
+# et cases X : un module compilé à partir d'une autre version de
+# othello_core.pyx est écarté plutôt que de faire jouer l'IA autrement.
+def _verifier_noyau():
+    try:
+        othello_core.configurer(CLASSES_POIDS, COINS, CASES_X, BONUS_COIN, MALUS_CASE_X)
+    except AttributeError:
+        return False
+    positions = [(COINS | CASES_X >> 1, CASES_X | 0x0000001818000000)]
+    mien, adverse = initialiser_plateau()
+    for i in range(60):
+        positions.append((mien, adverse))
+        cases = liste_cases(coups_valides(mien, adverse))
+        if not cases:
+            mien, adverse = adverse, mien
+            continue
+        mien, adverse = appliquer_coup(mien, adverse, 1 << cases[i % len(cases)])
+        mien, adverse = adverse, mien
+    for mien, adverse in positions:
+        for m, a in ((mien, adverse), (adverse, mien)):
+            m, a = _u64(m), _u64(a)
+            coups = coups_valides(m, a)
+            if (othello_core.coups_valides(m, a) != coups
+                    or othello_core.evaluer(m, a) != evaluer(m, a)
+                    or othello_core.score_final(m, a) != score_final(m, a)):
+                return False
+            for case in liste_cases(coups):
+                if othello_core.retournements(m, a, 1 << case) != retournements(m, a, _u64(1 << case)):
+                    return False
+    return True
+
+
+if othello_core is not None and not _verifier_noyau():
+    warnings.warn("othello_core ne correspond pas à ce fichier (à recompiler) : il n'est pas utilisé")
+    othello_core = None
+
+# La recherche parallèle de la racine n'est activée par défaut que sur une
+# machine à plusieurs cœurs et en Python pur (voir negamax_parallele)
+PARALLELE = (os.cpu_count() or 1) > 1 and np is None and othello_core is None
+
+# Nombre de cases vides à partir duquel la finale est cherchée jusqu'au bout :
+# un coup prend en général un dixième de seconde, une seconde au pire, avec
+# Numba ou othello_core à 14 cases vides, et en Python pur à 10 cases vides
+VIDES_FINALE = 10 if np is None and othello_core is None else 14
+
+
+# Crée une table de transposition vide : (mien, adverse) ->
+# (profondeur, score, nature du score, meilleur coup, masque des coups valides).
+# Avec le noyau compilé, c'est la table de taille fixe de othello_core.
+def nouvelle_table():
+    if othello_core is not None:
+        return othello_core.Table()
+    if np is None:
+        return {}
+    return Dict.empty(types.UniTuple(types.uint64, 2),
+                      types.Tuple((types.int64, types.int64, types.int64, types.uint64, types.uint64)))
+
+
+# Algorithme Negamax avec recherche à variation principale (PVS)
+def negamax(mien, adverse, profondeur, alpha=-INFINI, beta=INFINI, table=None):
     """
-    Implémentation de l'algorithme Alpha-Beta, une optimisation de Minimax.
-    Alpha-Beta permet d'éliminer des branches de recherche qui ne peuvent pas
-    influencer la décision finale, ce qui rend l'algorithme beaucoup plus rapide.
+    Implémentation d'Alpha-Beta sous forme Negamax : le score d'une position pour
+    un joueur est l'opposé de son score pour l'adversaire, ce qui évite de séparer
+    les cas maximisant et minimisant.
+
+    La recherche à variation principale (PVS) cherche le premier coup avec la
+    fenêtre complète, puis prouve avec une fenêtre nulle (alpha, alpha + 1), bien
+    moins coûteuse, que les coups suivants ne font pas mieux. Un coup qui
+    dépasse malgré tout alpha est recherché une seconde fois avec la fenêtre complète.
 
     Args:
-        plateau: État actuel du plateau de jeu
+        mien: Bitboard des pions du joueur dont c'est le tour
+        adverse: Bitboard des pions de l'adversaire
         profondeur: Nombre de coups à anticiper
-        joueur: Symbole du joueur dont c'est le tour ('X' ou 'O')
-        alpha: Meilleur score que le maximisant peut garantir
-        beta: Meilleur score que le minimisant peut garantir
-        maximisant: Boolean indiquant si on cherche à maximiser (True) ou minimiser (False)
+        alpha: Score que le joueur est déjà sûr d'obtenir
+        beta: Score au-delà duquel l'adversaire évitera cette position
+        table: Table de transposition à réutiliser d'un appel à l'autre (voir nouvelle_table)
 
     Retourne:
-        Un tuple (score, coup) où score est la valeur de la position et coup est le meilleur mouvement
+        Un tuple (score, case) où score est la valeur de la position du point de vue
+        du joueur qui a le trait et case est le meilleur mouvement (None si aucun)
     """
-    if profondeur == 0 or est_fin_partie(plateau):
-        return evaluer(plateau, joueur), None
+    if table is None:
+        table = nouvelle_table()
+    elif len(table) > TAILLE_MAX_TABLE:
+        table.clear()
+    if othello_core is not None:
+        score, coup = othello_core.negamax(mien, adverse, profondeur, alpha, beta, table)
+    else:
+        score, coup = _negamax(mien, adverse, profondeur, alpha, beta, False, table)
+    return score, (coup.bit_length() - 1 if coup else None)
 
-    coups = coups_valides(plateau, joueur)
-    if not coups:
-        score, _ = alpha_beta(plateau, profondeur - 1, 'O' if joueur == 'X' else 'X', alpha, beta, not maximisant)
-        return score, None
 
-    meilleur_coup = None
+# Étapes de la recherche d'un coup dans un cadre de la pile de _negamax
+COUP_PRINCIPAL, FENETRE_NULLE, NOUVELLE_RECHERCHE = 0, 1, 2
+
+# Place réservée aux coups de chaque cadre (une position n'en a jamais plus de 33)
+MAX_COUPS = 64
 
-    for coup in coups:
-        copie = [row[:] for row in plateau]
-        appliquer_coup(copie, coup[0], coup[1], joueur)
-        score, _ = alpha_beta(copie, profondeur - 1, 'O' if joueur == 'X' else 'X', alpha, beta, not maximisant)
 
-        if maximisant:
+# Noyau numérique de Negamax : uniquement des entiers, compilable par Numba.
+# La récursion est remplacée par une pile explicite de cadres, un par niveau
+# de profondeur, rangés dans des listes parallèles préallouées : on évite ainsi
+# la création d'un cadre Python à chaque nœud. Une seule génération de coups
+# par nœud : la fin de partie se déduit d'un masque vide alors que
+# l'adversaire vient de passer.
+@njit('Tuple((int64, uint64))(uint64, uint64, int64, int64, int64, boolean,'
+      ' DictType(UniTuple(uint64, 2), Tuple((int64, int64, int64, uint64, uint64))))', cache=True)
+def _negamax(mien, adverse, profondeur, alpha, beta, passe, table):
+    # Chaque coup (ou passe) consomme un niveau : profondeur + 1 cadres suffisent.
+    # Les coups du cadre k sont rangés dans p_pions[k * MAX_COUPS:p_fin[k]].
+    taille = profondeur + 1
+    p_mien = [ZERO] * taille
+    p_adverse = [ZERO] * taille
+    p_profondeur = [0] * taille
+    p_alpha = [0] * taille
+    p_beta = [0] * taille
+    p_alpha_initial = [0] * taille
+    p_passe = [False] * taille
+    p_coups = [ZERO] * taille
+    p_pions = [ZERO] * (taille * MAX_COUPS)
+    p_notes = [0] * (taille * MAX_COUPS)
+    p_fin = [0] * taille
+    p_indice = [0] * taille
+    p_etape = [0] * taille
+    p_meilleur_score = [0] * taille
+    p_meilleur_coup = [ZERO] * taille
+
+    k = 0
+    p_mien[0], p_adverse[0], p_profondeur[0] = mien, adverse, profondeur
+    p_alpha[0], p_beta[0], p_passe[0] = alpha, beta, passe
+    entrer = True
+    resultat = 0
+
+    while True:
+        if entrer:
+            # Entrée dans le nœud k : soit il est résolu sur place (feuille, fin de
+            # partie, table de transposition), soit on empile son premier enfant
+            entrer = False
+            mien, adverse, profondeur = p_mien[k], p_adverse[k], p_profondeur[k]
+            if profondeur == 0:
+                resultat = evaluer(mien, adverse)
+            else:
+                # La table de transposition mémorise aussi le masque des coups : une
+                # position revue (nouvelle recherche PVS, itération suivante de
+                # l'approfondissement) n'a pas à les générer de nouveau
+                entree = table.get((mien, adverse))
+                if entree is not None:
+                    profondeur_table, score_table, nature, coup_table, coups = entree
+                else:
+                    profondeur_table, score_table, nature, coup_table = -1, 0, EXACT, ZERO
+                    coups = coups_valides(mien, adverse)
+                p_coups[k] = coups
+                if not coups:
+                    if p_passe[k]:
+                        resultat = score_final(mien, adverse)
+                    else:
+                        # Passer son tour : l'adversaire joue sur le même plateau
+                        p_mien[k + 1], p_adverse[k + 1] = adverse, mien
+                        p_profondeur[k + 1] = profondeur - 1
+                        p_alpha[k + 1], p_beta[k + 1] = -p_beta[k], -p_alpha[k]
+                        p_passe[k + 1] = True
+                        k += 1
+                        entrer = True
+                        continue
+                else:
+                    # Une position déjà cherchée assez profondément donne directement
+                    # son score, ou au moins une borne qui resserre la fenêtre
+                    alpha, beta = p_alpha[k], p_beta[k]
+                    resolu = False
+                    if profondeur_table >= profondeur:
+                        if nature == EXACT:
+                            resolu = True
+                        elif nature == BORNE_INF:
+                            alpha = max(alpha, score_table)
+                        else:
+                            beta = min(beta, score_table)
+                        if alpha >= beta:
+                            resolu = True
+                    if resolu:
+                        resultat = score_table
+                        p_meilleur_coup[k] = coup_table
+                    else:
+                        p_alpha[k], p_beta[k], p_alpha_initial[k] = alpha, beta, alpha
+                        p_meilleur_score[k] = -INFINI
+                        p_meilleur_coup[k] = ZERO
+                        p_indice[k] = k * MAX_COUPS
+                        p_fin[k] = _ordonner_coups(mien, adverse, coups, profondeur, coup_table,
+                                                   p_pions, p_notes, p_indice[k])
+                        p_etape[k] = COUP_PRINCIPAL
+                        # Jouer le coup par XOR : le cadre k garde l'état d'avant le
+                        # coup, annuler le coup ne coûte donc rien
+                        pion = p_pions[p_indice[k]]
+                        retournes = retournements(mien, adverse, pion)
+                        p_mien[k + 1], p_adverse[k + 1] = adverse ^ retournes, mien ^ (pion | retournes)
+                        p_profondeur[k + 1] = profondeur - 1
+                        p_alpha[k + 1], p_beta[k + 1] = -beta, -alpha
+                        p_passe[k + 1] = False
+                        k += 1
+                        entrer = True
+                        continue
+
+        # Retour : `resultat` est le score du nœud k du point de vue de son joueur
+        if k == 0:
+            return resultat, p_meilleur_coup[0]
+        k -= 1
+        score = -resultat
+
+        if not p_coups[k]:
+            # Nœud où le joueur a passé : il remonte simplement le score
+            resultat = score
+            p_meilleur_coup[k] = ZERO
+            continue
+
+        alpha, beta = p_alpha[k], p_beta[k]
+        if p_etape[k] == FENETRE_NULLE and alpha < score < beta:
+            # Échec de la preuve : nouvelle recherche avec la fenêtre complète
+            p_etape[k] = NOUVELLE_RECHERCHE
+            p_profondeur[k + 1] = p_profondeur[k] - 1
+            p_alpha[k + 1], p_beta[k + 1] = -beta, -alpha
+            p_passe[k + 1] = False
+            k += 1
+            entrer = True
+            continue
+
+        coupe = False
+        if score > p_meilleur_score[k]:
+            p_meilleur_score[k] = score
+            p_meilleur_coup[k] = p_pions[p_indice[k]]
             if score > alpha:
-                alpha, meilleur_coup = score, coup
-            if alpha >= beta:
-                break  # Coupe alpha: cette branche ne peut pas produire un meilleur résultat
+                alpha = score
+                p_alpha[k] = alpha
+                coupe = alpha >= beta  # Coupe beta: l'adversaire ne laissera pas jouer cette position
+
+        p_indice[k] += 1
+        if not coupe and p_indice[k] < p_fin[k]:
+            # Coup suivant, d'abord avec une fenêtre nulle : prouver qu'il ne dépasse pas alpha
+            mien, adverse = p_mien[k], p_adverse[k]
+            pion = p_pions[p_indice[k]]
+            retournes = retournements(mien, adverse, pion)
+            p_mien[k + 1], p_adverse[k + 1] = adverse ^ retournes, mien ^ (pion | retournes)
+            p_etape[k] = FENETRE_NULLE
+            p_profondeur[k + 1] = p_profondeur[k] - 1
+            p_alpha[k + 1], p_beta[k + 1] = -alpha - 1, -alpha
+            p_passe[k + 1] = False
+            k += 1
+            entrer = True
+            continue
+
+        # Tous les coups sont vus (ou coupe) : ranger le résultat dans la table
+        resultat = p_meilleur_score[k]
+        if resultat <= p_alpha_initial[k]:
+            nature = BORNE_SUP
+        elif resultat >= beta:
+            nature = BORNE_INF
         else:
-            if score < beta:
-                beta, meilleur_coup = score, coup
-            if beta <= alpha:
-                break  # Coupe beta: cette branche ne peut pas produire un meilleur résultat
+            nature = EXACT
+        table[(p_mien[k], p_adverse[k])] = (p_profondeur[k], resultat, nature, p_meilleur_coup[k], p_coups[k])
 
-    return (alpha if maximisant else beta), meilleur_coup
+
+# Score d'un enfant de la racine, cherché dans un processus de calcul. Chaque
+# enfant a une table neuve : les tâches arrivent dans les processus dans un ordre
+# quelconque, et une table conservée d'une tâche à l'autre rendrait le score et
+# le coup trouvés différents d'une exécution à l'autre
+def _chercher_enfant(mien, adverse, profondeur, alpha, beta):
+    score, _ = negamax(_u64(mien), _u64(adverse), profondeur, alpha, beta, nouvelle_table())
+    return score
+
+
+# Processus de calcul partagés par toutes les recherches, créés au premier besoin
+_executeur = None
+
+
+def _executeur_racine():
+    global _executeur
+    if _executeur is None:
+        _executeur = ProcessPoolExecutor(max_workers=os.cpu_count())
+        atexit.register(_executeur.shutdown)
+    return _executeur
+
+
+# Negamax dont les coups de la racine sont cherchés en parallèle
+def negamax_parallele(mien, adverse, profondeur, premier=None, table=None):
+    """
+    Cherche le premier coup de la racine dans ce processus pour fixer alpha, puis
+    tous les autres à la fois dans des processus de calcul, chacun avec la fenêtre
+    (alpha, INFINI) : le premier coup, s'il est bon, rend ces recherches peu
+    coûteuses. Chaque coup suivant est cherché avec une table de transposition
+    neuve, pour un résultat qui ne dépend pas de l'ordre des tâches ; celle-ci
+    (table) ne sert qu'au premier coup.
+
+    Le coût des échanges entre processus (quelques millisecondes par recherche) n'est
+    regagné que sur les recherches longues du Python pur : sous Numba ou avec
+    othello_core, une recherche complète à PROFONDEUR_MAX prend environ 1 ms.
+
+    Args:
+        mien: Bitboard des pions du joueur dont c'est le tour
+        adverse: Bitboard des pions de l'adversaire
+        profondeur: Nombre de coups à anticiper
+        premier: Case à chercher en premier (le meilleur coup d'une recherche
+            moins profonde, par exemple)
+        table: Table de transposition du premier coup (voir nouvelle_table)
+
+    Retourne:
+        Un tuple (score, case) comme negamax
+    """
+    mien, adverse = _u64(mien), _u64(adverse)
+    coups = _u64(coups_valides(mien, adverse))
+    if not coups or profondeur < 2:
+        return negamax(mien, adverse, profondeur, table=table)
+
+    # Ordre des coups de la racine, le coup `premier` en tête
+    if np is None:
+        pions, notes = [ZERO] * MAX_COUPS, [0] * MAX_COUPS
+    else:
+        pions, notes = np.zeros(MAX_COUPS, np.uint64), np.zeros(MAX_COUPS, np.int64)
+    premier = ZERO if premier is None else _u64(1 << premier)
+    fin = _ordonner_coups(mien, adverse, coups, profondeur, premier, pions, notes, 0)
+
+    enfants = []
+    for pion in pions[:fin]:
+        retournes = retournements(mien, adverse, pion)
+        enfants.append((pion, adverse ^ retournes, mien ^ (pion | retournes)))
+
+    pion, nouveau_mien, nouvel_adverse = enfants[0]
+    score, _ = negamax(nouveau_mien, nouvel_adverse, profondeur - 1, table=table)
+    alpha, meilleur_coup = -score, pion
+
+    executeur = _executeur_racine()
+    futurs = [executeur.submit(_chercher_enfant, int(nouveau_mien), int(nouvel_adverse),
+                               profondeur - 1, -INFINI, -alpha)
+              for _, nouveau_mien, nouvel_adverse in enfants[1:]]
+    for (pion, _, _), futur in zip(enfants[1:], futurs):
+        score = -futur.result()
+        if score > alpha:
+            alpha, meilleur_coup = score, pion
+    return alpha, int(meilleur_coup).bit_length() - 1
+
+
+# Choisit le coup de l'IA par approfondissement itératif
+def choisir_coup(mien, adverse, profondeur_max=PROFONDEUR_MAX, duree_max=DUREE_MAX, table=None,
+                 parallele=False):
+    """
+    Lance Negamax aux profondeurs 1, 2, 3... jusqu'à profondeur_max ou jusqu'à
+    épuisement du budget de temps. Chaque itération laisse dans la table de
+    transposition le meilleur coup de chaque position, qui est essayé en premier
+    à l'itération suivante : les recherches peu profondes coûtent peu et
+    améliorent fortement l'ordre des coups de la recherche finale.
+
+    Args:
+        mien: Bitboard des pions du joueur dont c'est le tour
+        adverse: Bitboard des pions de l'adversaire
+        profondeur_max: Profondeur de la dernière itération
+        duree_max: Budget de temps indicatif en secondes
+        table: Table de transposition à réutiliser d'un coup à l'autre
+        parallele: Répartir les coups de la racine entre plusieurs processus à
+            partir de PROFONDEUR_PARALLELE (voir negamax_parallele)
+
+    Retourne:
+        La meilleure case trouvée (None si aucun coup n'est possible)
+    """
+    if table is None:
+        table = nouvelle_table()
+    debut = time.perf_counter()
+    meilleur = None
+    for profondeur in range(1, profondeur_max + 1):
+        if parallele and profondeur >= PROFONDEUR_PARALLELE:
+            _, meilleur = negamax_parallele(mien, adverse, profondeur, meilleur, table)
+        else:
+            _, meilleur = negamax(mien, adverse, profondeur, table=table)
+        if time.perf_counter() - debut > duree_max:
+            break
+    return meilleur
+
+
+# Résolution des finales sur carte graphique. La racine est développée sur deux
+# coups en une frontière de positions (un coup de la racine, une réponse de
+# l'adversaire), où le joueur de la racine a de nouveau le trait ; chaque fil
+# d'exécution en résout une jusqu'au bout par un Alpha-Beta sur pile explicite,
+# coups ordonnés par classes de poids. Les fils d'un même coup de la racine
+# partagent leur borne beta (la meilleure réponse trouvée jusque-là), et tous
+# reçoivent l'alpha prouvé par le premier coup de la racine, résolu d'abord.
+if CUDA:
+    # Chaque cadre de la pile est un coup ou une passe (voir resoudre_finale)
+    CADRES_FINALE = 2 * VIDES_FINALE + 2
+    FILS_PAR_BLOC = 64
+
+    def _compiler_gpu(source, nom):
+        return cuda.jit(device=True)(_executer(source, nom))
+
+    _coups_valides_gpu = _compiler_gpu(_source_coups_valides(), "coups_valides")
+    _retournements_gpu = _compiler_gpu(_source_retournements(), "retournements")
+
+    # Prochain coup du cadre k : le premier de la meilleure classe qui en contient
+    @cuda.jit(device=True)
+    def _prochain_coup_gpu(p_coups, p_classe, k, classes):
+        while not p_coups[k] & classes[p_classe[k]]:
+            p_classe[k] += 1
+        reste = p_coups[k] & classes[p_classe[k]]
+        pion = reste & (~reste + UN)
+        p_coups[k] ^= pion
+        return pion
+
+    @cuda.jit(device=True)
+    def _resoudre_gpu(mien, adverse, alpha, beta, classes):
+        p_mien = cuda.local.array(CADRES_FINALE, types.uint64)
+        p_adverse = cuda.local.array(CADRES_FINALE, types.uint64)
+        p_coups = cuda.local.array(CADRES_FINALE, types.uint64)
+        p_classe = cuda.local.array(CADRES_FINALE, types.int32)
+        p_alpha = cuda.local.array(CADRES_FINALE, types.int32)
+        p_beta = cuda.local.array(CADRES_FINALE, types.int32)
+        p_meilleur_score = cuda.local.array(CADRES_FINALE, types.int32)
+        p_passe = cuda.local.array(CADRES_FINALE, types.boolean)
+
+        k = 0
+        p_mien[0], p_adverse[0] = mien, adverse
+        p_alpha[0], p_beta[0], p_passe[0] = alpha, beta, False
+        entrer = True
+        resultat = 0
+
+        while True:
+            if entrer:
+                entrer = False
+                mien, adverse = p_mien[k], p_adverse[k]
+                coups = _coups_valides_gpu(mien, adverse)
+                p_coups[k] = coups
+                if not coups and p_passe[k]:
+                    # Deux passes de suite : la partie est finie
+                    resultat = cuda.popc(mien) - cuda.popc(adverse)
+                else:
+                    if coups:
+                        p_classe[k] = 0
+                        p_meilleur_score[k] = -INFINI
+                        pion = _prochain_coup_gpu(p_coups, p_classe, k, classes)
+                        retournes = _retournements_gpu(mien, adverse, pion)
+                        p_mien[k + 1], p_adverse[k + 1] = adverse ^ retournes, mien ^ (pion | retournes)
+                    else:
+                        # Passer son tour : INFINI, qu'aucun score réel n'atteint,
+                        # marque le nœud qui remontera le score de l'adversaire
+                        p_meilleur_score[k] = INFINI
+                        p_mien[k + 1], p_adverse[k + 1] = adverse, mien
+                    p_alpha[k + 1], p_beta[k + 1] = -p_beta[k], -p_alpha[k]
+                    p_passe[k + 1] = not coups
+                    k += 1
+                    entrer = True
+                    continue
+
+            if k == 0:
+                return resultat
+            k -= 1
+            score = -resultat
+            if p_meilleur_score[k] == INFINI:
+                resultat = score
+                continue
+
+            if score > p_meilleur_score[k]:
+                p_meilleur_score[k] = score
+                if score > p_alpha[k]:
+                    p_alpha[k] = score
+            if p_alpha[k] >= p_beta[k] or not p_coups[k]:
+                resultat = p_meilleur_score[k]
+                continue
+
+            # Coup suivant avec la fenêtre resserrée
+            mien, adverse = p_mien[k], p_adverse[k]
+            pion = _prochain_coup_gpu(p_coups, p_classe, k, classes)
+            retournes = _retournements_gpu(mien, adverse, pion)
+            p_mien[k + 1], p_adverse[k + 1] = adverse ^ retournes, mien ^ (pion | retournes)
+            p_alpha[k + 1], p_beta[k + 1] = -p_beta[k], -p_alpha[k]
+            p_passe[k + 1] = False
+            k += 1
+            entrer = True
+
+    # Un fil par position de la frontière : son score (vu du joueur de la racine)
+    # resserre aussitôt la borne beta des autres réponses au même coup de la racine.
+    # La signature explicite compile le noyau à l'import, pas pendant la partie.
+    @cuda.jit('void(uint64[:], uint64[:], int64[:], int32, int32[:], uint64[:], int32[:])')
+    def _noyau_finale(miens, adverses, racines, alpha, betas, classes, scores):
+        i = cuda.grid(1)
+        if i < miens.size:
+            racine = racines[i]
+            score = _resoudre_gpu(miens[i], adverses[i], alpha, betas[racine], classes)
+            scores[i] = score
+            cuda.atomic.min(betas, racine, score)
+
+
+# Liste les cases d'un masque de coups, de la meilleure classe de poids à la pire
+def _cases_ordonnees(coups):
+    return [case for _, classe in CLASSES_POIDS for case in liste_cases(int(coups) & int(classe))]
+
+
+# Résout une finale sur la carte graphique ; retourne (score, case) comme resoudre_finale
+def _resoudre_finale_gpu(mien, adverse):
+    cases = _cases_ordonnees(coups_valides(mien, adverse))
+    if not cases:
+        vides = TAILLE * TAILLE - int(mien | adverse).bit_count()
+        return negamax(mien, adverse, 2 * vides + 2)
+
+    # Frontière : pour chaque coup de la racine, les positions après chaque réponse
+    # (ou la position elle-même si l'adversaire doit passer), vues de la racine
+    frontiere = [[] for _ in cases]
+    for i, case in enumerate(cases):
+        nouveau_mien, nouvel_adverse = appliquer_coup(mien, adverse, 1 << case)
+        reponses = _cases_ordonnees(coups_valides(nouvel_adverse, nouveau_mien))
+        if not reponses:
+            frontiere[i].append((nouveau_mien, nouvel_adverse))
+        for reponse in reponses:
+            sien, le_mien = appliquer_coup(nouvel_adverse, nouveau_mien, 1 << reponse)
+            frontiere[i].append((le_mien, sien))
+
+    classes = cuda.to_device(np.array([classe for _, classe in CLASSES_POIDS], np.uint64))
+    betas = cuda.to_device(np.full(len(cases), INFINI, np.int32))
+
+    def lancer(indices, alpha):
+        positions = [(i, m, a) for i in indices for m, a in frontiere[i]]
+        racines = np.array([i for i, _, _ in positions], np.int64)
+        scores = cuda.device_array(len(positions), np.int32)
+        blocs = (len(positions) + FILS_PAR_BLOC - 1) // FILS_PAR_BLOC
+        _noyau_finale[blocs, FILS_PAR_BLOC](
+            cuda.to_device(np.array([m for _, m, _ in positions], np.uint64)),
+            cuda.to_device(np.array([a for _, _, a in positions], np.uint64)),
+            cuda.to_device(racines), alpha, betas, classes, scores)
+        scores = scores.copy_to_host()
+        # Valeur de chaque coup de la racine : la pire de ses réponses
+        return {i: int(scores[racines == i].min()) for i in indices}
+
+    # Le premier coup, avec la fenêtre complète, donne un alpha exact
+    alpha = lancer([0], -INFINI)[0]
+    meilleur = 0
+    # Un coup dont une réponse ne dépasse pas alpha ne fait pas mieux que lui
+    if len(cases) > 1:
+        for i, score in lancer(range(1, len(cases)), alpha).items():
+            if score > alpha:
+                alpha, meilleur = score, i
+    return alpha, cases[meilleur]
+
+
+# Avec CUDA, la première finale est résolue des deux façons : la carte graphique
+# n'est gardée pour les suivantes que si elle a été plus rapide que le processeur
+_gpu_plus_rapide = None
+
+
+# Cherche une finale jusqu'au bout de la partie (voir VIDES_FINALE)
+def resoudre_finale(mien, adverse, table=None):
+    """
+    Lance Negamax assez profondément pour que chaque branche atteigne la fin de
+    la partie, notée par score_final (la différence de pions) au lieu d'une
+    estimation. Avec CUDA, jusqu'à VIDES_FINALE cases vides, la carte graphique
+    prend le relais si elle s'est montrée plus rapide (voir _gpu_plus_rapide).
+
+    Chaque coup et chaque passe consomme un niveau de profondeur ;
+    avec v cases vides, une branche compte au plus v coups et v + 1 passes
+    (jamais deux de suite avant la fin), et le nœud final doit encore avoir une
+    profondeur positive pour constater la double passe : 2 * v + 2 suffit.
+
+    Args:
+        mien: Bitboard des pions du joueur dont c'est le tour
+        adverse: Bitboard des pions de l'adversaire
+        table: Table de transposition à réutiliser d'un coup à l'autre
+
+    Retourne:
+        Un tuple (score, case) où score est la différence de pions finale du point
+        de vue du joueur qui a le trait, comme negamax
+    """
+    global _gpu_plus_rapide
+    vides = TAILLE * TAILLE - int(mien | adverse).bit_count()
+    if CUDA and vides <= VIDES_FINALE and _gpu_plus_rapide is not False:
+        if _gpu_plus_rapide:
+            return _resoudre_finale_gpu(mien, adverse)
+        debut = time.perf_counter()
+        resultat = negamax(mien, adverse, 2 * vides + 2, table=table)
+        duree_cpu = time.perf_counter() - debut
+        debut = time.perf_counter()
+        _resoudre_finale_gpu(mien, adverse)
+        _gpu_plus_rapide = time.perf_counter() - debut < duree_cpu
+        return resultat
+    return negamax(mien, adverse, 2 * vides + 2, table=table)
+
+
+# La boucle de jeu examine plusieurs fois le même plateau à chaque tour (fin de
+# partie, coups du joueur courant) : les masques de coups y sont mémorisés
+@functools.lru_cache(maxsize=100_000)
+def coups_memorises(mien, adverse):
+    return coups_valides(mien, adverse)
+
+
+# Vérifie si la partie est terminée, en réutilisant les coups mémorisés
+def partie_terminee(plateau):
+    pions_x, pions_o = plateau
+    return not coups_memorises(pions_x, pions_o) and not coups_memorises(pions_o, pions_x)
+
+
+# Retourne le code du contenu de la case (x, y) : X, O ou VIDE
+def contenu_case(plateau, x, y):
+    bit = 1 << (TAILLE * x + y)
+    if plateau[0] & bit:
+        return X
+    if plateau[1] & bit:
+        return O
+    return VIDE
+
+
+# Retourne le couple (mien, adverse) vu du joueur donné
+def point_de_vue(plateau, joueur):
+    return plateau if joueur == X else plateau[::-1]
 
 
 # Fonction pour afficher le plateau de jeu de manière lisible
@@ -216,20 +1012,19 @@ def afficher_plateau(plateau):
     Affiche le plateau de jeu dans la console de manière lisible.
 
     Args:
-        plateau: État actuel du plateau de jeu
+        plateau: Couple (pions X, pions O) des bitboards du plateau
     """
+    pions_x, pions_o = plateau
     print("  0 1 2 3 4 5 6 7")
     print(" +-+-+-+-+-+-+-+-+")
     for i in range(TAILLE):
         print(f"{i}|", end="")
         for j in range(TAILLE):
-            print(f"{plateau[i][j]}|", end="")
+            print(f"{SYMBOLES[contenu_case(plateau, i, j)]}|", end="")
         print("\n +-+-+-+-+-+-+-+-+")
 
     # Affiche le nombre de pions par joueur
-    x_count = sum(row.count('X') for row in plateau)
-    o_count = sum(row.count('O') for row in plateau)
-    print(f"Score: X: {x_count}, O: {o_count}")
+    print(f"Score: X: {pions_x.bit_count()}, O: {pions_o.bit_count()}")
 
 
 # Boucle principale du jeu
@@ -239,23 +1034,27 @@ def jouer_jeu():
     Alterne entre les tours du joueur humain et de l'IA jusqu'à la fin de la partie.
     Affiche le résultat final une fois la partie terminée.
     """
-    plateau = initialiser_plateau()
-    joueur_humain = 'X'  # Le joueur humain utilise les 'X'
-    joueur_ia = 'O'     # L'IA utilise les 'O'
-    courant = 'X'       # Le joueur X commence toujours dans Othello
+    plateau = initialiser_plateau()  # Couple (pions X, pions O)
+    joueur_humain = X  # Le joueur humain utilise les 'X'
+    joueur_ia = O     # L'IA utilise les 'O'
+    courant = X       # Le joueur X commence toujours dans Othello
+    table = nouvelle_table()  # Table de transposition conservée tout au long de la partie
 
     # Boucle principale du jeu
-    while not est_fin_partie(plateau):
+    while not partie_terminee(plateau):
         # Afficher le plateau et les scores actuels
         afficher_plateau(plateau)
-        print(f"Tour du joueur: {courant}")
+        print(f"Tour du joueur: {SYMBOLES[courant]}")
+
+        # Le couple (mien, adverse) vu du joueur courant
+        mien, adverse = point_de_vue(plateau, courant)
 
         if courant == joueur_humain:
             # Tour du joueur humain
-            coups = coups_valides(plateau, courant)
+            coups = [divmod(case, TAILLE) for case in liste_cases(coups_memorises(mien, adverse))]
             if not coups:
                 print("Pas de coup possible pour vous. Passage de tour.")
-                courant = 'O' if courant == 'X' else 'X'
+                courant = -courant
                 continue
 
             # Afficher les coups valides
@@ -270,39 +1069,44 @@ def jouer_jeu():
 
             # Vérifier si le coup est valide
             if (x, y) in coups:
-                appliquer_coup(plateau, x, y, courant)
+                mien, adverse = appliquer_coup(mien, adverse, 1 << (TAILLE * x + y))
             else:
                 print("Coup invalide. Veuillez choisir parmi les coups disponibles.")
                 continue
         else:
             # Tour de l'IA
-            coups = coups_valides(plateau, courant)
-            if not coups:
+            if not coups_memorises(mien, adverse):
                 print("L'IA passe son tour.")
-                courant = 'O' if courant == 'X' else 'X'
+                courant = -courant
                 continue
 
-            # L'IA utilise l'algorithme Alpha-Beta pour choisir son coup
+            # L'IA utilise l'algorithme Negamax (Alpha-Beta) pour choisir son coup
             print("L'IA réfléchit...")
-            # Utiliser Alpha-Beta pour de meilleures performances
-            _, coup = alpha_beta(plateau, 3, courant, float('-inf'), float('inf'), True)
+            if TAILLE * TAILLE - int(mien | adverse).bit_count() <= VIDES_FINALE:
+                # Finale cherchée jusqu'au bout de la partie
+                _, case = resoudre_finale(mien, adverse, table)
+            else:
+                # Approfondissement itératif pour de meilleures performances
+                case = choisir_coup(mien, adverse, table=table, parallele=PARALLELE)
 
-            if coup:
-                print(f"L'IA joue en {coup}")
-                appliquer_coup(plateau, coup[0], coup[1], courant)
+            if case is not None:
+                print(f"L'IA joue en {divmod(case, TAILLE)}")
+                mien, adverse = appliquer_coup(mien, adverse, 1 << case)
             else:
                 print("Erreur: L'IA n'a pas pu choisir de coup.")
 
+        plateau = point_de_vue((mien, adverse), courant)
+
         # Passage au joueur suivant
-        courant = 'O' if courant == 'X' else 'X'
+        courant = -courant
 
     # Fin de la partie - calculer et afficher les scores
     afficher_plateau(plateau)
-    score_x = sum(row.count('X') for row in plateau)
-    score_o = sum(row.count('O') for row in plateau)
-    
+    score_x = plateau[0].bit_count()
+    score_o = plateau[1].bit_count()
+
     print(f"Fin de la partie! Score final: Vous (X): {score_x}, IA (O): {score_o}")
-    
+
     if score_x > score_o:
         print("Vous avez gagné !")
     elif score_o > score_x:
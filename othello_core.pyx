@@ -0,0 +1,324 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Noyau compilé du moteur d'Othello : génération des coups, évaluation et
+recherche Negamax (PVS et table de transposition) sur des bitboards 64 bits.
+
+Ce module reprend les fonctions de « othello (1).py », qui l'utilise pour la
+recherche de l'IA dès qu'il est compilé :
+
+    cythonize -i othello_core.pyx
+
+Les conventions sont les mêmes : la case (x, y) est le bit 8*x + y, une position
+est le couple (mien, adverse) vu du joueur qui a le trait, un coup est le
+bitboard de la seule case jouée et 0 signifie « aucun coup ».
+
+Les réglages de l'évaluation et de l'ordre des coups ne sont écrits qu'une fois,
+dans « othello (1).py », qui les transmet par configurer() avant toute recherche.
+"""
+from libc.stdlib cimport malloc, free
+from libc.string cimport memset
+
+ctypedef unsigned long long u64
+
+cdef extern from *:
+    int __builtin_popcountll(unsigned long long) nogil
+
+# Bornes des scores de recherche et nature du score stocké dans la table : les
+# scores sont des entiers 16 bits, l'évaluation ne dépassant pas 124 en valeur absolue
+cdef short INFINI = 32000
+cdef enum:
+    EXACT = 0
+    BORNE_INF = 1
+    BORNE_SUP = 2
+
+# Nombre de compartiments de deux entrées de la table de transposition (une puissance de 2)
+cdef Py_ssize_t TAILLE_TABLE = 1 << 17
+
+# Les 8 directions : décalage 8*dx + dy et masque des cases d'arrivée valides
+cdef u64 PLEIN = 0xFFFFFFFFFFFFFFFF
+cdef u64 SANS_COLONNE_0 = 0xFEFEFEFEFEFEFEFE
+cdef u64 SANS_COLONNE_7 = 0x7F7F7F7F7F7F7F7F
+cdef int DECALAGES[8]
+cdef u64 MASQUES[8]
+DECALAGES[:] = [-9, -8, -7, -1, 1, 7, 8, 9]
+MASQUES[:] = [SANS_COLONNE_7, PLEIN, SANS_COLONNE_0, SANS_COLONNE_7,
+              SANS_COLONNE_0, SANS_COLONNE_7, PLEIN, SANS_COLONNE_0]
+
+# Réglages de l'évaluation (différence de pions, bonus des coins, malus des cases
+# X) et classes de cases de même poids, de la meilleure à la pire, pour l'ordre
+# des coups : voir configurer
+cdef u64 COINS = 0
+cdef u64 CASES_X = 0
+cdef int BONUS_COIN = 0
+cdef int MALUS_CASE_X = 0
+cdef int NB_CLASSES = 0
+cdef int POIDS_CLASSES[64]
+cdef u64 MASQUES_CLASSES[64]
+
+
+def configurer(classes_poids, u64 coins, u64 cases_x, int bonus_coin, int malus_case_x):
+    """
+    Reçoit les réglages de « othello (1).py » : classes_poids est la suite des
+    couples (poids, masque des cases de ce poids), de la meilleure classe à la pire.
+    """
+    global COINS, CASES_X, BONUS_COIN, MALUS_CASE_X, NB_CLASSES
+    COINS, CASES_X = coins, cases_x
+    BONUS_COIN, MALUS_CASE_X = bonus_coin, malus_case_x
+    NB_CLASSES = 0
+    for poids, masque in classes_poids:
+        POIDS_CLASSES[NB_CLASSES] = poids
+        MASQUES_CLASSES[NB_CLASSES] = masque
+        NB_CLASSES += 1
+
+
+cdef inline u64 _decaler(u64 pions, int decalage) noexcept nogil:
+    if decalage > 0:
+        return pions << decalage
+    return pions >> -decalage
+
+
+# Retourne le masque des coups valides pour le joueur qui a le trait
+cpdef u64 coups_valides(u64 mien, u64 adverse) noexcept nogil:
+    cdef u64 vides = ~(mien | adverse)
+    cdef u64 valides = 0
+    cdef u64 a, t
+    cdef int d, i
+    for d in range(8):
+        a = adverse & MASQUES[d]
+        t = _decaler(mien, DECALAGES[d]) & a
+        for i in range(5):
+            t |= _decaler(t, DECALAGES[d]) & a
+        valides |= _decaler(t, DECALAGES[d]) & vides & MASQUES[d]
+    return valides
+
+
+# Retourne le bitboard des pions adverses encadrés par un coup, sans branchement :
+# la suite de pions adverses est étendue par doublement (1, 2, 4 puis 6 cases)
+# et gardée par un masque plein seulement si elle se termine sur un des nôtres
+cpdef u64 retournements(u64 mien, u64 adverse, u64 pion) noexcept nogil:
+    cdef u64 retournes = 0
+    cdef u64 a, paires, t
+    cdef int d, decalage
+    for d in range(8):
+        decalage = DECALAGES[d]
+        a = adverse & MASQUES[d]
+        paires = a & _decaler(a, decalage)
+        t = _decaler(pion, decalage) & a
+        t |= _decaler(t, decalage) & a
+        t |= _decaler(t, 2 * decalage) & paires
+        t |= _decaler(t, 2 * decalage) & paires
+        retournes |= t & (<u64> 0 - <u64> ((_decaler(t, decalage) & mien & MASQUES[d]) != 0))
+    return retournes
+
+
+# Applique un coup et retourne le nouveau couple (mien, adverse)
+cpdef tuple appliquer_coup(u64 mien, u64 adverse, u64 pion):
+    cdef u64 retournes = retournements(mien, adverse, pion)
+    return mien ^ (pion | retournes), adverse ^ retournes
+
+
+# Évalue la position du point de vue du joueur dont les pions sont `mien`
+cpdef short evaluer(u64 mien, u64 adverse) noexcept nogil:
+    return (__builtin_popcountll(mien) - __builtin_popcountll(adverse)
+            + BONUS_COIN * (__builtin_popcountll(mien & COINS) - __builtin_popcountll(adverse & COINS))
+            - MALUS_CASE_X * (__builtin_popcountll(mien & CASES_X) - __builtin_popcountll(adverse & CASES_X)))
+
+
+# Score d'une partie terminée : la seule différence de pions
+cpdef short score_final(u64 mien, u64 adverse) noexcept nogil:
+    return __builtin_popcountll(mien) - __builtin_popcountll(adverse)
+
+
+cdef struct Entree:
+    u64 mien
+    u64 adverse
+    u64 coup
+    u64 coups
+    short score
+    signed char profondeur
+    signed char nature
+    bint occupee
+    unsigned int recherche
+
+
+cdef class Table:
+    """
+    Table de transposition de taille fixe : chaque position a un compartiment de
+    deux entrées, choisi par hachage du couple (mien, adverse). La première
+    entrée garde la position cherchée le plus profondément pendant la recherche
+    en cours (la racine, dont le meilleur coup ouvre l'itération suivante de
+    l'approfondissement), la seconde prend toujours la dernière position venue.
+    Le couple complet est conservé pour que deux positions ne soient jamais confondues.
+    """
+    cdef Entree *entrees
+    cdef Py_ssize_t occupees
+    cdef unsigned int recherche
+
+    def __cinit__(self):
+        self.entrees = <Entree *> malloc(2 * TAILLE_TABLE * sizeof(Entree))
+        if self.entrees == NULL:
+            raise MemoryError()
+        self.clear()
+
+    def __dealloc__(self):
+        free(self.entrees)
+
+    def __len__(self):
+        return self.occupees
+
+    def clear(self):
+        memset(self.entrees, 0, 2 * TAILLE_TABLE * sizeof(Entree))
+        self.occupees = 0
+        self.recherche = 0
+
+
+cdef inline Py_ssize_t _indice(u64 mien, u64 adverse) noexcept nogil:
+    cdef u64 h = (mien ^ (adverse * <u64> 0x9E3779B97F4A7C15)) * <u64> 0xBF58476D1CE4E5B9
+    return <Py_ssize_t> ((h >> 32) & <u64> (TAILLE_TABLE - 1))
+
+
+# Retourne l'entrée de la position, ou NULL si elle n'est pas dans la table
+cdef inline Entree *_trouver(Table table, u64 mien, u64 adverse) noexcept nogil:
+    cdef Entree *compartiment = &table.entrees[2 * _indice(mien, adverse)]
+    cdef int i
+    for i in range(2):
+        if compartiment[i].occupee and compartiment[i].mien == mien and compartiment[i].adverse == adverse:
+            return &compartiment[i]
+    return NULL
+
+
+# Retourne l'entrée où ranger la position : la première du compartiment si elle
+# est libre, déjà à cette position, laissée par une recherche précédente ou moins
+# profonde, la seconde sinon. Une position rangée dans les deux est toujours
+# trouvée d'abord dans la première, qui est alors la plus récente.
+cdef inline Entree *_place(Table table, u64 mien, u64 adverse, int profondeur) noexcept nogil:
+    cdef Entree *compartiment = &table.entrees[2 * _indice(mien, adverse)]
+    cdef Entree *premiere = &compartiment[0]
+    if (not premiere.occupee or (premiere.mien == mien and premiere.adverse == adverse)
+            or premiere.recherche != table.recherche or premiere.profondeur <= profondeur):
+        return premiere
+    return &compartiment[1]
+
+
+# Ordonne les coups dans pions[] : le coup de la table d'abord, puis par poids de
+# case et, à partir de la profondeur 3, par l'évaluation un coup plus loin
+cdef int _ordonner_coups(u64 mien, u64 adverse, u64 coups, int profondeur, u64 premier,
+                         u64 *pions, int *notes) noexcept nogil:
+    cdef int fin = 0
+    cdef int c, i, note
+    cdef u64 reste, pion, retournes
+    if premier & coups:
+        pions[0] = premier
+        notes[0] = INFINI
+        fin = 1
+        coups ^= premier
+    for c in range(NB_CLASSES):
+        reste = coups & MASQUES_CLASSES[c]
+        while reste:
+            pion = reste & (~reste + 1)
+            reste ^= pion
+            note = POIDS_CLASSES[c]
+            if profondeur >= 3:
+                retournes = retournements(mien, adverse, pion)
+                note += evaluer(mien ^ (pion | retournes), adverse ^ retournes)
+            # Insertion en gardant les notes décroissantes (tri stable)
+            i = fin
+            while i > 0 and notes[i - 1] < note:
+                pions[i] = pions[i - 1]
+                notes[i] = notes[i - 1]
+                i -= 1
+            pions[i] = pion
+            notes[i] = note
+            fin += 1
+    return fin
+
+
+cdef short _negamax(Table table, u64 mien, u64 adverse, int profondeur, short alpha, short beta,
+                    bint passe, u64 *coup):
+    cdef u64 pions[64]
+    cdef int notes[64]
+    cdef u64 coups, coup_table = 0, pion, retournes, nouveau_mien, nouvel_adverse
+    cdef u64 meilleur_coup = 0, inutile
+    cdef int n, i, nature
+    cdef short score, meilleur_score, alpha_initial
+    cdef Entree *entree
+
+    coup[0] = 0
+    if profondeur == 0:
+        return evaluer(mien, adverse)
+
+    # Une position déjà vue fournit son masque de coups, et parfois son score
+    entree = _trouver(table, mien, adverse)
+    coups = entree.coups if entree != NULL else coups_valides(mien, adverse)
+
+    if not coups:
+        if passe:
+            return score_final(mien, adverse)
+        return -_negamax(table, adverse, mien, profondeur - 1, -beta, -alpha, True, &inutile)
+
+    if entree != NULL:
+        coup_table = entree.coup
+        if entree.profondeur >= profondeur:
+            if entree.nature == EXACT:
+                coup[0] = coup_table
+                return entree.score
+            if entree.nature == BORNE_INF:
+                alpha = max(alpha, entree.score)
+            else:
+                beta = min(beta, entree.score)
+            if alpha >= beta:
+                coup[0] = coup_table
+                return entree.score
+
+    alpha_initial = alpha
+    meilleur_score = -INFINI
+    n = _ordonner_coups(mien, adverse, coups, profondeur, coup_table, pions, notes)
+
+    for i in range(n):
+        pion = pions[i]
+        retournes = retournements(mien, adverse, pion)
+        nouveau_mien, nouvel_adverse = adverse ^ retournes, mien ^ (pion | retournes)
+        if i == 0:
+            score = -_negamax(table, nouveau_mien, nouvel_adverse, profondeur - 1, -beta, -alpha, False, &inutile)
+        else:
+            # Fenêtre nulle : prouver que ce coup ne dépasse pas alpha
+            score = -_negamax(table, nouveau_mien, nouvel_adverse, profondeur - 1, -alpha - 1, -alpha, False, &inutile)
+            if alpha < score < beta:
+                score = -_negamax(table, nouveau_mien, nouvel_adverse, profondeur - 1, -beta, -alpha, False, &inutile)
+
+        if score > meilleur_score:
+            meilleur_score, meilleur_coup = score, pion
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break  # Coupe beta: l'adversaire ne laissera pas jouer cette position
+
+    if meilleur_score <= alpha_initial:
+        nature = BORNE_SUP
+    elif meilleur_score >= beta:
+        nature = BORNE_INF
+    else:
+        nature = EXACT
+    # Le compartiment a pu être réutilisé par d'autres positions pendant la recherche
+    entree = _place(table, mien, adverse, profondeur)
+    if not entree.occupee:
+        table.occupees += 1
+    entree.mien, entree.adverse = mien, adverse
+    entree.coup, entree.coups = meilleur_coup, coups
+    entree.score, entree.profondeur, entree.nature = meilleur_score, profondeur, nature
+    entree.occupee = True
+    entree.recherche = table.recherche
+    coup[0] = meilleur_coup
+    return meilleur_score
+
+
+def negamax(u64 mien, u64 adverse, int profondeur, short alpha, short beta, Table table):
+    """
+    Recherche Negamax (PVS) ; retourne (score, coup) où score est vu du joueur
+    qui a le trait et coup est le bitboard du meilleur coup (0 si aucun).
+    """
+    cdef u64 coup
+    cdef short score
+    table.recherche += 1
+    score = _negamax(table, mien, adverse, profondeur, alpha, beta, False, &coup)
+    return score, coup
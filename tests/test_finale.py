@@ -0,0 +1,140 @@
+"""Vérifie resoudre_finale contre une résolution exhaustive à la différence de pions.
+
+Chaque moteur (Python pur, Numba, othello_core, CUDA simulé) est lancé dans son
+propre processus, puisque le choix du moteur se fait à l'import du script.
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "othello (1).py")
+
+# Positions (mien, adverse) à 6, 7 et 8 cases vides, le joueur « mien » au
+# trait ; chacune contient au moins une passe dans son arbre
+POSITIONS = [
+    (0xBE9383D3E36C7E79, 0x40687C2C1C128102),
+    (0x7870EAD3E8C48001, 0x068F152C173B5EBC),
+    (0x7D7B5E544E460008, 0x8084A12BB0B9FFE1),
+    (0xC0603C001802C1F1, 0x3A14C3FFE7FD2E0E),
+    (0x3E3052CE56FEB4F4, 0x81CF2D3129000A09),
+    (0xE073734355795981, 0x1F0C0CBC8A06063E),
+    (0x783F7F2F58B40000, 0x020080D0A74B7F5F),
+    (0x00040DD6E5F13910, 0x3DFBF2281A0E4663),
+    (0x8F4CFC3400808000, 0x4032024BFF7F7F77),
+]
+
+# Programme lancé dans le sous-processus : il charge le script (le préambule
+# écarte les moteurs non voulus) et écrit en JSON le moteur utilisé et, pour
+# chaque position, le score et la case rendus
+PROGRAMME = """
+import importlib.util, json, sys
+{preambule}
+spec = importlib.util.spec_from_file_location("othello", sys.argv[1])
+othello = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(othello)
+moteur = ("othello_core" if othello.othello_core is not None
+          else "numba" if othello.np is not None else "python")
+resultats = []
+for mien, adverse in json.loads(sys.argv[2]):
+    mien, adverse = othello._u64(mien), othello._u64(adverse)
+    score, case = othello.{resoudre}(mien, adverse)
+    resultats.append((int(score), int(case)))
+print(json.dumps({{"moteur": moteur, "resultats": resultats}}))
+"""
+
+SANS_NUMBA = "sys.modules['numba'] = None"
+SANS_NOYAU = "sys.modules['othello_core'] = None"
+
+MASQUE = 0xFFFFFFFFFFFFFFFF
+# Décalages des huit directions (case (x, y) = bit 8x + y) et masques des
+# colonnes à ne pas traverser
+SANS_COLONNE_0 = 0xFEFEFEFEFEFEFEFE
+SANS_COLONNE_7 = 0x7F7F7F7F7F7F7F7F
+DIRECTIONS = ((1, SANS_COLONNE_0), (-1, SANS_COLONNE_7), (8, MASQUE), (-8, MASQUE),
+              (9, SANS_COLONNE_0), (-9, SANS_COLONNE_7), (7, SANS_COLONNE_7), (-7, SANS_COLONNE_0))
+
+
+def _decaler(pions, decalage, masque):
+    pions = pions << decalage if decalage > 0 else pions >> -decalage
+    return pions & masque & MASQUE
+
+
+# Pions retournés en jouant la case, écrit indépendamment du script testé
+def _retournements(mien, adverse, case):
+    total = 0
+    for decalage, masque in DIRECTIONS:
+        ligne = 0
+        courant = _decaler(1 << case, decalage, masque)
+        while courant & adverse:
+            ligne |= courant
+            courant = _decaler(courant, decalage, masque)
+        if courant & mien:
+            total |= ligne
+    return total
+
+
+def _exhaustif(mien, adverse, passe=False):
+    vides = ~(mien | adverse) & MASQUE
+    meilleur = None
+    for case in range(64):
+        if vides >> case & 1:
+            pris = _retournements(mien, adverse, case)
+            if pris:
+                score = -_exhaustif(adverse & ~pris, mien | pris | 1 << case)
+                meilleur = score if meilleur is None else max(meilleur, score)
+    if meilleur is not None:
+        return meilleur
+    if passe:
+        return bin(mien).count("1") - bin(adverse).count("1")
+    return -_exhaustif(adverse, mien, True)
+
+
+def _disponible(module):
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ValueError:
+        return False
+
+
+class TestResoudreFinale(unittest.TestCase):
+
+    def _verifier(self, moteur, preambule, resoudre="resoudre_finale", env=None):
+        programme = PROGRAMME.format(preambule=preambule, resoudre=resoudre)
+        with tempfile.TemporaryDirectory() as cache:
+            # Cache Numba à part : le script y est chargé sous un autre nom
+            env = dict(os.environ, NUMBA_CACHE_DIR=cache, **(env or {}))
+            sortie = subprocess.run([sys.executable, "-W", "ignore", "-c", programme, SCRIPT,
+                                     json.dumps(POSITIONS)],
+                                    capture_output=True, text=True, env=env, check=True).stdout
+        donnees = json.loads(sortie.splitlines()[-1])
+        self.assertEqual(donnees["moteur"], moteur)
+        for (mien, adverse), (score, case) in zip(POSITIONS, donnees["resultats"]):
+            with self.subTest(mien=hex(mien), adverse=hex(adverse)):
+                self.assertEqual(score, _exhaustif(mien, adverse))
+                pris = _retournements(mien, adverse, case)
+                self.assertTrue(pris and not (mien | adverse) >> case & 1)
+                self.assertEqual(-_exhaustif(adverse & ~pris, mien | pris | 1 << case), score)
+
+    def test_python(self):
+        self._verifier("python", "\n".join((SANS_NUMBA, SANS_NOYAU)))
+
+    @unittest.skipUnless(_disponible("numba"), "Numba n'est pas installé")
+    def test_numba(self):
+        self._verifier("numba", SANS_NOYAU)
+
+    @unittest.skipUnless(_disponible("othello_core"), "othello_core n'est pas compilé")
+    def test_othello_core(self):
+        self._verifier("othello_core", "")
+
+    @unittest.skipUnless(_disponible("numba"), "Numba n'est pas installé")
+    def test_cuda_simule(self):
+        self._verifier("numba", SANS_NOYAU, resoudre="_resoudre_finale_gpu",
+                       env={"NUMBA_ENABLE_CUDASIM": "1"})
+
+
+if __name__ == "__main__":
+    unittest.main()